@@ -1,21 +1,36 @@
-// This script runs when MongoDB starts for the first time
-db = db.getSiblingDB('giveaway');
+// This script runs when MongoDB starts for the first time and is re-applied
+// by update.sh, so every statement must be safe to run more than once
+db = db.getSiblingDB(process.env.MONGO_INITDB_DATABASE || 'telegram_bot_db');
 
 // Create collections with indexes
 db.users.createIndex({ "user_id": 1 }, { unique: true });
-db.accounts.createIndex({ "user_id": 1 });
+db.users.createIndex({ "access_status": 1 });
+db.accounts.createIndex({ "user_id": 1, "_id": 1 });
+db.accounts.createIndex(
+  { "user_id": 1 },
+  {
+    name: "user_id_active_sessions",
+    partialFilterExpression: { "session_data": { "$exists": true } }
+  }
+);
 db.accounts.createIndex({ "phone_number": 1 });
 db.sessions.createIndex({ "account_id": 1 });
 db.sessions.createIndex({ "created_at": 1 });
 db.logs.createIndex({ "timestamp": 1 });
-db.logs.createIndex({ "user_id": 1 });
+db.logs.createIndex({ "user_id": 1, "timestamp": -1 });
 db.logs.createIndex({ "event_type": 1 });
 
 // Create initial settings
-db.settings.insertOne({
-  "monitoring_enabled": true,
-  "owner_id": parseInt(process.env.OWNER_ID || "0"),
-  "created_at": new Date()
-});
+db.settings.updateOne(
+  {},
+  {
+    $setOnInsert: {
+      "monitoring_enabled": true,
+      "owner_id": parseInt(process.env.OWNER_ID || "0"),
+      "created_at": new Date()
+    }
+  },
+  { upsert: true }
+);
 
 print("Database initialized successfully");
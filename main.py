@@ -12,8 +12,8 @@ class AlertManager:
         logging.info(f'Alert added: {uid}')  # Updated f-string
 
     def show_alerts(self):
-        for alert in self.alerts:
-            print(f'ID: {alert['id']}, Message: {alert['message']}')  # Updated f-string
+        if self.alerts:
+            print('\n'.join(f"ID: {alert['id']}, Message: {alert['message']}" for alert in self.alerts))
 
 class DevPanel:
     def _show_dev_panel(self):
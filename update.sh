@@ -17,4 +17,11 @@ docker-compose down
 docker-compose build --no-cache
 docker-compose up -d
 
+# Apply database indexes and settings (safe to re-run)
+echo "🗂️ Applying database indexes..."
+until docker-compose exec -T mongodb mongosh --quiet --eval 'db.runCommand("ping").ok' > /dev/null 2>&1; do
+    sleep 2
+done
+docker-compose exec -T mongodb sh -c 'mongosh --quiet -u "$MONGO_INITDB_ROOT_USERNAME" -p "$MONGO_INITDB_ROOT_PASSWORD" --authenticationDatabase admin /docker-entrypoint-initdb.d/init-mongo.js'
+
 echo "✅ Update completed!"